@@ -0,0 +1,408 @@
+"""
+ONNX模型轻量解析器
+直接解码protobuf wire格式, 只保留查看器需要展示的字段,
+节点属性、文档字符串、权重数据等其余字段按长度前缀整段跳过
+"""
+
+import os
+import sys
+import mmap
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+
+# 标量字段类型
+_INT = "int"
+_STR = "str"
+
+# 各消息的解码表: 字段号 -> (属性名, 类型或子消息解码表, 是否repeated)
+# 字段号对应 onnx.proto 中的定义
+_DIMENSION = {
+    1: ("dim_value", _INT, False),
+    2: ("dim_param", _STR, False),
+}
+_SHAPE = {
+    1: ("dim", _DIMENSION, True),
+}
+_TENSOR_TYPE = {
+    1: ("elem_type", _INT, False),
+    2: ("shape", _SHAPE, False),
+}
+_TYPE = {
+    1: ("tensor_type", _TENSOR_TYPE, False),
+}
+_VALUE_INFO = {
+    1: ("name", _STR, False),
+    2: ("type", _TYPE, False),
+}
+_TENSOR = {
+    1: ("dims", _INT, True),
+    2: ("data_type", _INT, False),
+    8: ("name", _STR, False),
+}
+_NODE = {
+    4: ("op_type", _STR, False),
+}
+_GRAPH = {
+    1: ("node", _NODE, True),
+    2: ("name", _STR, False),
+    5: ("initializer", _TENSOR, True),
+    11: ("input", _VALUE_INFO, True),
+    12: ("output", _VALUE_INFO, True),
+}
+_OPERATOR_SET_ID = {
+    1: ("domain", _STR, False),
+    2: ("version", _INT, False),
+}
+_STRING_STRING_ENTRY = {
+    1: ("key", _STR, False),
+    2: ("value", _STR, False),
+}
+_MODEL = {
+    1: ("ir_version", _INT, False),
+    2: ("producer_name", _STR, False),
+    3: ("producer_version", _STR, False),
+    7: ("graph", _GRAPH, False),
+    8: ("opset_import", _OPERATOR_SET_ID, True),
+    14: ("metadata_props", _STRING_STRING_ENTRY, True),
+}
+
+# 只读取元数据时的解码表, 节点和初始值等整段跳过
+_METADATA_GRAPH = {
+    2: ("name", _STR, False),
+}
+_METADATA_MODEL = {
+    7: ("graph", _METADATA_GRAPH, False),
+    14: ("metadata_props", _STRING_STRING_ENTRY, True),
+}
+
+
+def _read_varint(buf, pos):
+    """读取一个varint, 返回 (值, 新位置)"""
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError("varint过长")
+
+
+def _to_int64(value):
+    """varint按int64解释(负数以补码编码)"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _new_message(schema):
+    """按解码表创建带默认值的消息对象, 与protobuf未设置字段的行为一致"""
+    msg = SimpleNamespace()
+    for name, kind, repeated in schema.values():
+        if repeated:
+            value = []
+        elif kind is _INT:
+            value = 0
+        elif kind is _STR:
+            value = ""
+        else:
+            value = _new_message(kind)
+        setattr(msg, name, value)
+    return msg
+
+
+def _decode_message(buf, pos, end, schema):
+    """解码 buf[pos:end] 范围内的一条消息"""
+    msg = _new_message(schema)
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        wire_type = key & 7
+        spec = schema.get(key >> 3)
+
+        if wire_type == 0:
+            value, pos = _read_varint(buf, pos)
+            if spec is None:
+                continue
+            name, kind, repeated = spec
+            if kind is not _INT:
+                raise ValueError(f"字段 {name} 的wire类型不匹配")
+            if repeated:
+                getattr(msg, name).append(_to_int64(value))
+            else:
+                setattr(msg, name, _to_int64(value))
+        elif wire_type == 2:
+            length, pos = _read_varint(buf, pos)
+            start = pos
+            pos += length
+            if pos > end:
+                raise ValueError("消息被截断")
+            if spec is None:
+                continue
+            name, kind, repeated = spec
+            if kind is _STR:
+                value = bytes(buf[start:pos]).decode("utf-8", "replace")
+            elif kind is _INT:
+                # packed编码的repeated整数
+                if not repeated:
+                    raise ValueError(f"字段 {name} 的wire类型不匹配")
+                values = getattr(msg, name)
+                while start < pos:
+                    value, start = _read_varint(buf, start)
+                    values.append(_to_int64(value))
+                continue
+            else:
+                value = _decode_message(buf, start, pos, kind)
+            if repeated:
+                getattr(msg, name).append(value)
+            else:
+                setattr(msg, name, value)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"不支持的wire类型: {wire_type}")
+
+    if pos != end:
+        raise ValueError("消息被截断")
+    return msg
+
+
+def _encode_varint(value):
+    """编码一个非负varint"""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _iter_fields(buf, pos, end):
+    """遍历 buf[pos:end] 范围内消息的字段
+
+    产出 (字段号, wire类型, 字段起始, 值起始, 字段结束);
+    对length-delimited字段, 值起始位于长度前缀之后
+    """
+    while pos < end:
+        start = pos
+        key, pos = _read_varint(buf, pos)
+        wire_type = key & 7
+        value_start = pos
+        if wire_type == 0:
+            _, pos = _read_varint(buf, pos)
+        elif wire_type == 2:
+            length, value_start = _read_varint(buf, pos)
+            pos = value_start + length
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"不支持的wire类型: {wire_type}")
+        if pos > end:
+            raise ValueError("消息被截断")
+        yield key >> 3, wire_type, start, value_start, pos
+
+
+def _rewrite(buf, pos, end, rewriters, drop=()):
+    """复制一条消息, length-delimited字段若在 rewriters 中则替换为其返回值 (返回None则丢弃该字段)
+
+    drop 中的字段无论wire类型都直接丢弃
+    """
+    parts = []
+    # 连续未改动的字段合并为一次切片复制
+    copy_start = pos
+    for field, wire_type, start, value_start, field_end in _iter_fields(buf, pos, end):
+        if field in drop:
+            value = None
+        else:
+            rewrite = rewriters.get(field) if wire_type == 2 else None
+            if rewrite is None:
+                continue
+            value = rewrite(value_start, field_end)
+        parts.append(buf[copy_start:start])
+        copy_start = field_end
+        if value is not None:
+            parts.append(_encode_varint(field << 3 | 2))
+            parts.append(_encode_varint(len(value)))
+            parts.append(value)
+    parts.append(buf[copy_start:end])
+    return b"".join(parts)
+
+
+# TensorProto中的类型化数据字段:
+# float_data=4, int32_data=5, string_data=6, int64_data=7, double_data=10, uint64_data=11
+_TENSOR_DATA_FIELDS = frozenset((4, 5, 6, 7, 10, 11))
+
+
+def split_raw_data(data):
+    """复制序列化的ModelProto, 去掉 graph.initializer 中的权重数据
+
+    raw_data及各类型化数据字段 (float_data等) 都会被去掉且不会被复制,
+    只记录其在原数据中的位置, 可配合内存映射按需读取
+
+    Args:
+        data: 序列化的ModelProto
+
+    Returns:
+        (去掉权重数据后的序列化数据, {初始值名称: (偏移, 字节数, 是否为raw_data)});
+        是raw_data时记录的是raw_data本身的位置, 否则是整个TensorProto的位置
+    """
+    spans = {}
+
+    def rewrite_tensor(start, end):
+        name, span = "", None
+
+        def take_name(value_start, value_end):
+            nonlocal name
+            name = bytes(data[value_start:value_end]).decode("utf-8", "replace")
+            return data[value_start:value_end]
+
+        def take_raw_data(value_start, value_end):
+            nonlocal span
+            span = (value_start, value_end - value_start, True)
+            return None
+
+        tensor = _rewrite(data, start, end, {8: take_name, 9: take_raw_data}, _TENSOR_DATA_FIELDS)
+        if span is None and len(tensor) != end - start:
+            # 去掉的是类型化数据, 按需读取时需要解析整个张量
+            span = (start, end - start, False)
+        if span is not None:
+            spans[name] = span
+        return tensor
+
+    def rewrite_graph(start, end):
+        return _rewrite(data, start, end, {5: rewrite_tensor})
+
+    # 字段号: ModelProto.graph=7, GraphProto.initializer=5, TensorProto.name=8, TensorProto.raw_data=9
+    stripped = _rewrite(data, 0, len(data), {7: rewrite_graph})
+    return stripped, spans
+
+
+def parse_model(data):
+    """从序列化的ModelProto字节中解码查看器所需的字段
+
+    Args:
+        data: 序列化的ModelProto (bytes等支持索引和切片的对象)
+
+    Returns:
+        与onnx.ModelProto属性名一致的轻量对象
+    """
+    return _decode_message(data, 0, len(data), _MODEL)
+
+
+# 纯Python解码的速度约为protobuf (upb) 的1/6, 但可省去导入onnx的约0.3秒;
+# 去掉权重后的模型数据小于此大小时纯Python解码更快
+_PURE_DECODE_LIMIT = 2 * 1024 * 1024
+
+
+def open_mapping(model_path):
+    """只读内存映射模型文件, 数据直接从页缓存读取而不复制到Python堆上
+
+    Args:
+        model_path: ONNX模型文件路径
+
+    Returns:
+        mmap对象, 由调用者负责关闭; 空文件无法映射, 返回None
+    """
+    with open(model_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+@contextmanager
+def _map_file(model_path):
+    """在with块内映射模型文件, 空文件产出b"""""
+    mm = open_mapping(model_path)
+    if mm is None:
+        yield b""
+        return
+    with mm:
+        yield mm
+
+
+def _parse_model_proto(data, stripped):
+    """将数据解析为ModelProto
+
+    Args:
+        data: 序列化的ModelProto
+        stripped: split_raw_data去掉权重数据后的结果, 权重不会复制到protobuf堆上;
+            为None表示wire格式已损坏
+
+    Returns:
+        onnx.ModelProto
+    """
+    # onnx导入开销较大, 只在需要ModelProto时导入
+    import onnx
+    model = onnx.ModelProto()
+    if stripped is None:
+        # 直接交给protobuf解析以给出其错误信息
+        with memoryview(data) as view:
+            model.ParseFromString(view)
+    else:
+        model.ParseFromString(stripped)
+    return model
+
+
+def parse_model_proto(data):
+    """将序列化数据解析为ModelProto, 初始值的权重数据在解析前去掉
+
+    Args:
+        data: 序列化的ModelProto
+
+    Returns:
+        (onnx.ModelProto, {初始值名称: (偏移, 字节数, 是否为raw_data)}), 见split_raw_data
+    """
+    try:
+        stripped, spans = split_raw_data(data)
+    except (ValueError, IndexError):
+        stripped, spans = None, {}
+    return _parse_model_proto(data, stripped), spans
+
+
+def load_model(model_path):
+    """加载ONNX模型, 初始值的权重数据不会被读入
+
+    一般由protobuf解析去掉权重后的数据; 模型很小且onnx尚未导入时,
+    改用纯Python解码只保留展示所需的字段, 省去导入onnx的开销
+
+    Args:
+        model_path: ONNX模型文件路径
+
+    Returns:
+        可按ModelProto属性访问的模型对象
+    """
+    with _map_file(model_path) as data:
+        try:
+            stripped, _ = split_raw_data(data)
+        except (ValueError, IndexError):
+            stripped = None
+        if stripped is not None and len(stripped) < _PURE_DECODE_LIMIT and "onnx" not in sys.modules:
+            try:
+                return parse_model(stripped)
+            except (ValueError, IndexError):
+                pass
+        return _parse_model_proto(data, stripped)
+
+
+def load_metadata(model_path):
+    """只读取ONNX模型的图名称和custom metadata
+
+    解码失败时回退为load_model
+
+    Args:
+        model_path: ONNX模型文件路径
+
+    Returns:
+        带 graph.name 和 metadata_props 属性的模型对象
+    """
+    with _map_file(model_path) as data:
+        try:
+            return _decode_message(data, 0, len(data), _METADATA_MODEL)
+        except (ValueError, IndexError):
+            pass
+    return load_model(model_path)
@@ -5,57 +5,68 @@ ONNX模型信息查看器 - CLI Pretty版本
 """
 
 import sys
+import math
 import argparse
-import onnx
 from collections import Counter
-from pathlib import Path
+from itertools import islice
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.text import Text
-    from rich import box
-except ImportError as e:
-    print(f"错误: 需要安装 rich 库")
-    print(f"详情: {e}")
-    print("请运行: pip install rich")
-    sys.exit(1)
+from _fastparse import load_model
 
 
-console = Console()
+# rich 在开始渲染时才导入, --help / --version 等路径无需承担导入开销
+console = None
+
+
+def _load_rich():
+    """按需导入rich库"""
+    global console, Table, Panel, Text, box
+    if console is not None:
+        return
+    try:
+        from rich.console import Console
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich.text import Text
+        from rich import box
+    except ImportError as e:
+        print(f"错误: 需要安装 rich 库")
+        print(f"详情: {e}")
+        print("请运行: pip install rich")
+        sys.exit(1)
+    console = Console()
+
+
+# 数据类型名称, 按 TensorProto.DataType 枚举值索引
+_DTYPE_NAMES = (
+    "UNDEFINED", "[green]FLOAT32[/green]", "UINT8", "INT8",
+    "UINT16", "INT16", "INT32", "[cyan]INT64[/cyan]",
+    "STRING", "BOOL", "[yellow]FLOAT16[/yellow]",
+    "[blue]DOUBLE[/blue]", "UINT32", "UINT64",
+    "COMPLEX64", "COMPLEX128", "[magenta]BFLOAT16[/magenta]",
+)
 
 
 def get_tensor_shape(tensor):
     """获取张量形状"""
-    try:
-        dims = tensor.type.tensor_type.shape.dim
-        shape = []
-        for dim in dims:
-            if dim.dim_value > 0:
-                shape.append(str(dim.dim_value))
-            elif dim.dim_param:
-                shape.append(f"[dim]{dim.dim_param}[/dim]")
-            else:
-                shape.append("[dim]?[/dim]")
-        return f"[{' × '.join(shape)}]"
-    except:
-        return "[?]"
+    shape = []
+    append = shape.append
+    for dim in tensor.type.tensor_type.shape.dim:
+        value = dim.dim_value
+        if value > 0:
+            append(str(value))
+        else:
+            append(f"[dim]{dim.dim_param}[/dim]" if dim.dim_param else "[dim]?[/dim]")
+    return "[" + " × ".join(shape) + "]"
 
 
 def get_dtype_name(dtype):
     """获取数据类型名称"""
-    dtype_names = {
-        0: "UNDEFINED", 1: "[green]FLOAT32[/green]", 2: "UINT8", 3: "INT8",
-        4: "UINT16", 5: "INT16", 6: "INT32", 7: "[cyan]INT64[/cyan]",
-        8: "STRING", 9: "BOOL", 10: "[yellow]FLOAT16[/yellow]",
-        11: "[blue]DOUBLE[/blue]", 12: "UINT32", 13: "UINT64",
-        14: "COMPLEX64", 15: "COMPLEX128", 16: "[magenta]BFLOAT16[/magenta]"
-    }
-    return dtype_names.get(dtype, f"[red]UNKNOWN({dtype})[/red]")
+    if 0 <= dtype < len(_DTYPE_NAMES):
+        return _DTYPE_NAMES[dtype]
+    return f"[red]UNKNOWN({dtype})[/red]"
 
 
-def show_metadata(model):
+def show_metadata(model, op_counter, total_nodes, init_element_counts, show_stats=True):
     """显示元信息"""
     graph = model.graph
 
@@ -94,26 +105,27 @@ def show_metadata(model):
     else:
         content.append(f"[bold cyan]自定义元数据:[/bold cyan] [dim](无)[/dim]")
 
-    # 统计摘要
-    total_nodes = len(graph.node)
-    total_inputs = len(graph.input)
-    total_outputs = len(graph.output)
-    total_initializers = len(graph.initializer)
-    op_types = len(set(node.op_type for node in graph.node))
-
-    # 计算参数量
-    import numpy as np
-    total_params = sum(int(np.prod(init.dims)) for init in graph.initializer if init.dims)
-    if total_params >= 1_000_000:
-        params_str = f"{total_params / 1_000_000:.2f}M"
-    elif total_params >= 1_000:
-        params_str = f"{total_params / 1_000:.2f}K"
+    # 统计摘要 (需要遍历全部节点和权重, --brief 时跳过)
+    if not show_stats:
+        content.append(f"\n[bold cyan]统计摘要:[/bold cyan] [dim](统计已跳过; 去掉 --brief 查看)[/dim]")
     else:
-        params_str = str(total_params)
+        total_inputs = len(graph.input)
+        total_outputs = len(graph.output)
+        total_initializers = len(graph.initializer)
+        op_types = len(op_counter)
+
+        # 计算参数量
+        total_params = sum(init_element_counts)
+        if total_params >= 1_000_000:
+            params_str = f"{total_params / 1_000_000:.2f}M"
+        elif total_params >= 1_000:
+            params_str = f"{total_params / 1_000:.2f}K"
+        else:
+            params_str = str(total_params)
 
-    content.append(f"\n[bold cyan]统计摘要:[/bold cyan]")
-    content.append(f"    • 输入: [yellow]{total_inputs}[/yellow] | 输出: [yellow]{total_outputs}[/yellow] | 节点: [yellow]{total_nodes}[/yellow]")
-    content.append(f"    • 算子种类: [yellow]{op_types}[/yellow] | 权重: [yellow]{total_initializers}[/yellow] | 参数量: [bold green]{params_str}[/bold green]")
+        content.append(f"\n[bold cyan]统计摘要:[/bold cyan]")
+        content.append(f"    • 输入: [yellow]{total_inputs}[/yellow] | 输出: [yellow]{total_outputs}[/yellow] | 节点: [yellow]{total_nodes}[/yellow]")
+        content.append(f"    • 算子种类: [yellow]{op_types}[/yellow] | 权重: [yellow]{total_initializers}[/yellow] | 参数量: [bold green]{params_str}[/bold green]")
 
     console.print(Panel("\n".join(content), title="[bold white]1. 元信息[/bold white]", title_align="left", border_style="bright_blue"))
 
@@ -141,34 +153,30 @@ def show_inputs_outputs(graph):
     console.print(table)
 
 
-def show_operators_table(graph):
+def show_operators_table(op_counter, total_nodes):
     """显示算子表格"""
-    op_counter = Counter(node.op_type for node in graph.node)
-    total_nodes = len(graph.node)
-
     table = Table(title="[bold white]3. 算子信息[/bold white]", show_header=True, header_style="bold magenta", box=box.ROUNDED)
     table.add_column("算子类型", style="cyan", ratio=3)
     table.add_column("数量", style="yellow", width=8)
     table.add_column("占比", style="green", width=10)
-    table.add_column("分布", style="white", ratio=2)
-
-    # 计算百分比并生成条形图
-    for op_type, count in op_counter.most_common():
-        percentage = (count / total_nodes) * 100
-        bar_length = int(percentage / 2)
-        bar = "█" * bar_length
-
-        table.add_row(
-            op_type,
-            f"[yellow]{count}[/yellow]",
-            f"[green]{percentage:.1f}%[/green]",
-            f"[bright_black]{bar}[/bright_black]"
-        )
+    table.add_column("分布", style="bright_black", ratio=2)
+
+    # 计算百分比并生成条形图 (条形长度为百分比的一半), 颜色由列样式提供
+    # 条形长度用整数除法, 避免浮点误差使100%的条形少一格
+    # 没有节点的图直接输出空表格
+    percent_per_node = 100.0 / total_nodes if total_nodes else 0.0
+    rows = [
+        (op_type, str(count), "%.1f%%" % (count * percent_per_node), "█" * (count * 50 // total_nodes))
+        for op_type, count in op_counter.most_common()
+    ]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
     console.print(table)
 
 
-def show_initializers(graph):
+def show_initializers(graph, init_element_counts):
     """显示权重信息（如果有）"""
     if not graph.initializer:
         return
@@ -179,11 +187,9 @@ def show_initializers(graph):
     table.add_column("数据类型", style="green", width=12)
     table.add_column("元素数", style="cyan", width=10)
 
-    import numpy as np
-    for init in graph.initializer[:20]:  # 最多显示20个
+    for init, total_elements in zip(islice(graph.initializer, 20), init_element_counts):  # 最多显示20个
         shape = str(list(init.dims))
         dtype = get_dtype_name(init.data_type)
-        total_elements = int(np.prod(init.dims)) if init.dims else 0
 
         # 格式化数字
         if total_elements >= 1_000_000:
@@ -195,9 +201,10 @@ def show_initializers(graph):
 
         table.add_row(init.name, shape, dtype, elements_str)
 
-    if len(graph.initializer) > 20:
+    total_initializers = len(init_element_counts)
+    if total_initializers > 20:
         table.add_row(
-            f"[dim]... 还有 {len(graph.initializer) - 20} 个[/dim]",
+            f"[dim]... 还有 {total_initializers - 20} 个[/dim]",
             "[dim]...[/dim]",
             "[dim]...[/dim]",
             "[dim]...[/dim]"
@@ -206,29 +213,46 @@ def show_initializers(graph):
     console.print(table)
 
 
-def show_model_info(model_path, show_operators=False, show_weights=False):
+def show_model_info(model_path, show_operators=False, show_weights=False, check=False, brief=False):
     """显示模型信息"""
+    _load_rich()
     try:
-        onnx.checker.check_model(model_path)
-        model = onnx.load(model_path)
+        if check:
+            import onnx
+            onnx.checker.check_model(model_path)
+        model = load_model(model_path)
         graph = model.graph
 
-        console.print()
-        console.print(Panel(f"[bold cyan]ONNX 模型分析[/bold cyan]", border_style="bright_blue", padding=(0, 1)))
-
-        show_metadata(model)
-        console.print()
-        show_inputs_outputs(graph)
-        console.print()
-
-        if show_operators:
-            show_operators_table(graph)
+        # 只遍历一次节点, 元信息和算子表格共用统计结果
+        show_stats = not brief
+        op_counter, total_nodes = None, 0
+        if show_stats or show_operators:
+            op_types = [node.op_type for node in graph.node]
+            op_counter = Counter(op_types)
+            total_nodes = len(op_types)
+        # 每个权重的元素数, 参数量统计和权重表格共用
+        init_element_counts = None
+        if show_stats or show_weights:
+            init_element_counts = [math.prod(init.dims) if init.dims else 0 for init in graph.initializer]
+
+        # 缓冲全部输出, 渲染完成后一次性写出
+        with console:
             console.print()
+            console.print(Panel(f"[bold cyan]ONNX 模型分析[/bold cyan]", border_style="bright_blue", padding=(0, 1)))
 
-        if show_weights:
-            show_initializers(graph)
+            show_metadata(model, op_counter, total_nodes, init_element_counts, show_stats)
+            console.print()
+            show_inputs_outputs(graph)
             console.print()
 
+            if show_operators:
+                show_operators_table(op_counter, total_nodes)
+                console.print()
+
+            if show_weights:
+                show_initializers(graph, init_element_counts)
+                console.print()
+
         return 0
 
     except FileNotFoundError:
@@ -250,6 +274,7 @@ def main():
   %(prog)s model.onnx              # 查看基本信息
   %(prog)s model.onnx --ops        # 显示算子信息
   %(prog)s model.onnx -w           # 显示权重信息
+  %(prog)s model.onnx -b           # 跳过统计摘要
         """
     )
 
@@ -270,6 +295,18 @@ def main():
         help="显示权重/初始值信息"
     )
 
+    parser.add_argument(
+        "-b", "--brief",
+        action="store_true",
+        help="跳过统计摘要 (不遍历节点和权重, 适合超大模型)"
+    )
+
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="加载前先用onnx.checker校验模型"
+    )
+
     parser.add_argument(
         "-v", "--version",
         action="version",
@@ -278,7 +315,7 @@ def main():
 
     args = parser.parse_args()
 
-    return show_model_info(args.model, show_operators=args.ops, show_weights=args.weights)
+    return show_model_info(args.model, show_operators=args.ops, show_weights=args.weights, check=args.check, brief=args.brief)
 
 
 if __name__ == "__main__":
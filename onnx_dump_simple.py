@@ -5,10 +5,21 @@ ONNX模型信息查看器 - CLI版本
 """
 
 import sys
+import math
 import argparse
-import onnx
 from collections import Counter
 
+from _fastparse import load_model
+
+# 数据类型名称, 按 TensorProto.DataType 枚举值索引
+_DTYPE_NAMES = (
+    "UNDEFINED", "FLOAT32", "UINT8", "INT8",
+    "UINT16", "INT16", "INT32", "INT64",
+    "STRING", "BOOL", "FLOAT16", "DOUBLE",
+    "UINT32", "UINT64", "COMPLEX64",
+    "COMPLEX128", "BFLOAT16",
+)
+
 
 def print_section(title):
     """打印分节标题"""
@@ -28,38 +39,31 @@ def print_tensor_info(tensor, prefix=""):
 
 def get_tensor_shape(tensor):
     """获取张量形状"""
-    try:
-        dims = tensor.type.tensor_type.shape.dim
-        shape = []
-        for dim in dims:
-            if dim.dim_value > 0:
-                shape.append(str(dim.dim_value))
-            elif dim.dim_param:
-                shape.append(dim.dim_param)
-            else:
-                shape.append("?")
-        return f"[{', '.join(shape)}]"
-    except:
-        return "[?]"
+    shape = []
+    append = shape.append
+    for dim in tensor.type.tensor_type.shape.dim:
+        value = dim.dim_value
+        if value > 0:
+            append(str(value))
+        else:
+            append(dim.dim_param or "?")
+    return "[" + ", ".join(shape) + "]"
 
 
 def get_dtype_name(dtype):
     """获取数据类型名称"""
-    dtype_names = {
-        0: "UNDEFINED", 1: "FLOAT32", 2: "UINT8", 3: "INT8",
-        4: "UINT16", 5: "INT16", 6: "INT32", 7: "INT64",
-        8: "STRING", 9: "BOOL", 10: "FLOAT16", 11: "DOUBLE",
-        12: "UINT32", 13: "UINT64", 14: "COMPLEX64",
-        15: "COMPLEX128", 16: "BFLOAT16"
-    }
-    return dtype_names.get(dtype, f"UNKNOWN({dtype})")
+    if 0 <= dtype < len(_DTYPE_NAMES):
+        return _DTYPE_NAMES[dtype]
+    return f"UNKNOWN({dtype})"
 
 
-def show_model_info(model_path, show_operators=False):
+def show_model_info(model_path, show_operators=False, check=False):
     """显示模型信息"""
     try:
-        onnx.checker.check_model(model_path)
-        model = onnx.load(model_path)
+        if check:
+            import onnx
+            onnx.checker.check_model(model_path)
+        model = load_model(model_path)
         graph = model.graph
 
         # ========== 1. 元信息 ==========
@@ -109,9 +113,10 @@ def show_model_info(model_path, show_operators=False):
             print_section("3. 算子信息")
 
             # 统计算子
-            op_counter = Counter(node.op_type for node in graph.node)
+            op_types = [node.op_type for node in graph.node]
+            op_counter = Counter(op_types)
 
-            print(f"\n总节点数: {len(graph.node)}")
+            print(f"\n总节点数: {len(op_types)}")
             print(f"算子种类: {len(op_counter)}")
             print(f"\n算子列表 (按使用次数排序):")
 
@@ -122,8 +127,7 @@ def show_model_info(model_path, show_operators=False):
         initializer_count = len(graph.initializer)
         if initializer_count > 0:
             # 计算参数量
-            import numpy as np
-            total_params = sum(int(np.prod(init.dims)) for init in graph.initializer if init.dims)
+            total_params = sum(math.prod(init.dims) for init in graph.initializer if init.dims)
             if total_params >= 1_000_000:
                 params_str = f"{total_params / 1_000_000:.2f}M"
             elif total_params >= 1_000:
@@ -168,6 +172,12 @@ def main():
         help="显示算子信息"
     )
 
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="加载前先用onnx.checker校验模型"
+    )
+
     parser.add_argument(
         "-v", "--version",
         action="version",
@@ -176,7 +186,7 @@ def main():
 
     args = parser.parse_args()
 
-    return show_model_info(args.model, show_operators=args.ops)
+    return show_model_info(args.model, show_operators=args.ops, check=args.check)
 
 
 if __name__ == "__main__":
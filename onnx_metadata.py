@@ -4,25 +4,29 @@ ONNX模型Custom Metadata处理工具
 支持导出和导入ONNX模型的custom metadata
 """
 
+import os
 import sys
 import argparse
-import onnx
-from pathlib import Path
 
+from _fastparse import load_metadata
 
-def export_metadata(model_path, output_file):
+
+def export_metadata(model_path, output_file, check=False):
     """导出ONNX模型的custom metadata到文本文件
 
     Args:
         model_path: ONNX模型文件路径
         output_file: 输出的文本文件路径
+        check: 是否先用onnx.checker校验模型
 
     Returns:
         0成功, 1失败
     """
     try:
-        onnx.checker.check_model(model_path)
-        model = onnx.load(model_path)
+        if check:
+            import onnx
+            onnx.checker.check_model(model_path)
+        model = load_metadata(model_path)
 
         if not model.metadata_props:
             print(f"警告: 模型中没有custom metadata", file=sys.stderr)
@@ -31,8 +35,7 @@ def export_metadata(model_path, output_file):
             return 0
 
         with open(output_file, 'w', encoding='utf-8') as f:
-            for prop in model.metadata_props:
-                f.write(f"{prop.key}\t{prop.value}\n")
+            f.write("".join(f"{prop.key}\t{prop.value}\n" for prop in model.metadata_props))
 
         print(f"成功导出 {len(model.metadata_props)} 条metadata到: {output_file}")
         return 0
@@ -45,7 +48,7 @@ def export_metadata(model_path, output_file):
         return 1
 
 
-def import_metadata(model_path, metadata_file, output_path, mode="merge"):
+def import_metadata(model_path, metadata_file, output_path, mode="merge", check=False):
     """从文本文件导入custom metadata到ONNX模型
 
     Args:
@@ -53,6 +56,7 @@ def import_metadata(model_path, metadata_file, output_path, mode="merge"):
         metadata_file: metadata文本文件路径
         output_path: 输出ONNX模型文件路径
         mode: 导入模式, "replace"=完全替换, "merge"=合并(默认)
+        check: 是否先用onnx.checker校验模型
 
     Returns:
         0成功, 1失败
@@ -62,27 +66,34 @@ def import_metadata(model_path, metadata_file, output_path, mode="merge"):
         metadata_dict = {}
         try:
             with open(metadata_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.rstrip('\n')
-                    if not line:
-                        continue
-                    # 按第一个tab分割
-                    parts = line.split('\t', 1)
-                    if len(parts) == 2:
-                        key, value = parts
-                        metadata_dict[key] = value
-                    else:
-                        print(f"警告: 跳过无效行: {line}", file=sys.stderr)
+                data = f.read()
         except FileNotFoundError:
             print(f"错误: 找不到metadata文件 '{metadata_file}'", file=sys.stderr)
             return 1
 
+        # 不用splitlines, 避免值中的其他Unicode换行符被误切分
+        for line in data.split('\n'):
+            if not line:
+                continue
+            # 按第一个tab分割
+            key, sep, value = line.partition('\t')
+            if sep:
+                metadata_dict[key] = value
+            else:
+                print(f"警告: 跳过无效行: {line}", file=sys.stderr)
+
         if not metadata_dict:
             print(f"警告: metadata文件为空", file=sys.stderr)
 
         # 加载模型
-        onnx.checker.check_model(model_path)
-        model = onnx.load(model_path)
+        # 输出与输入在同一目录时, 外部权重文件的相对路径依然有效,
+        # 无需把权重读入内存再写回; 否则需要加载外部数据随新模型一起保存
+        # onnx导入开销较大, 只在需要完整ModelProto时导入
+        import onnx
+        if check:
+            onnx.checker.check_model(model_path)
+        same_dir = os.path.dirname(os.path.abspath(model_path)) == os.path.dirname(os.path.abspath(output_path))
+        model = onnx.load(model_path, load_external_data=not same_dir)
 
         original_count = len(model.metadata_props)
 
@@ -93,13 +104,14 @@ def import_metadata(model_path, metadata_file, output_path, mode="merge"):
 
         # 合并模式: 先删除文件中存在的key的旧值
         elif mode == "merge":
-            keys_to_remove = []
-            for i, prop in enumerate(model.metadata_props):
-                if prop.key in metadata_dict:
-                    keys_to_remove.append(i)
-            # 从后往前删除, 避免索引问题
-            for i in reversed(keys_to_remove):
-                del model.metadata_props[i]
+            # 一次遍历收集需保留的项后整体重建, 避免逐个删除带来的O(n^2)开销
+            kept = [(prop.key, prop.value) for prop in model.metadata_props if prop.key not in metadata_dict]
+            removed_count = original_count - len(kept)
+            del model.metadata_props[:]
+            for key, value in kept:
+                prop = model.metadata_props.add()
+                prop.key = key
+                prop.value = value
 
         # 添加新的metadata
         for key, value in metadata_dict.items():
@@ -115,9 +127,9 @@ def import_metadata(model_path, metadata_file, output_path, mode="merge"):
             print(f"  (原 {original_count} 条已全部替换)")
         else:
             new_count = len(model.metadata_props)
-            added_count = new_count - (original_count - len(keys_to_remove))
+            added_count = new_count - (original_count - removed_count)
             print(f"成功导入 {len(metadata_dict)} 条metadata到: {output_path}")
-            print(f"  (更新 {len(keys_to_remove)} 条, 新增 {added_count} 条, 保留 {new_count - len(metadata_dict)} 条原有)")
+            print(f"  (更新 {removed_count} 条, 新增 {added_count} 条, 保留 {new_count - len(metadata_dict)} 条原有)")
 
         return 0
 
@@ -126,18 +138,21 @@ def import_metadata(model_path, metadata_file, output_path, mode="merge"):
         return 1
 
 
-def list_metadata(model_path):
+def list_metadata(model_path, check=False):
     """列出ONNX模型的custom metadata
 
     Args:
         model_path: ONNX模型文件路径
+        check: 是否先用onnx.checker校验模型
 
     Returns:
         0成功, 1失败
     """
     try:
-        onnx.checker.check_model(model_path)
-        model = onnx.load(model_path)
+        if check:
+            import onnx
+            onnx.checker.check_model(model_path)
+        model = load_metadata(model_path)
 
         if not model.metadata_props:
             print("模型中没有custom metadata")
@@ -183,6 +198,7 @@ metadata文件格式:
     export_parser = subparsers.add_parser("export", help="导出metadata到文本文件")
     export_parser.add_argument("model", help="输入ONNX模型文件 (.onnx)")
     export_parser.add_argument("output", help="输出metadata文本文件")
+    export_parser.add_argument("--check", action="store_true", help="加载前先用onnx.checker校验模型")
 
     # import命令
     import_parser = subparsers.add_parser("import", help="从文本文件导入metadata")
@@ -195,10 +211,12 @@ metadata文件格式:
         default="merge",
         help="导入模式: merge=合并更新(默认), replace=完全替换"
     )
+    import_parser.add_argument("--check", action="store_true", help="加载前先用onnx.checker校验模型")
 
     # list命令
     list_parser = subparsers.add_parser("list", help="列出模型的metadata")
     list_parser.add_argument("model", help="ONNX模型文件 (.onnx)")
+    list_parser.add_argument("--check", action="store_true", help="加载前先用onnx.checker校验模型")
 
     parser.add_argument(
         "-v", "--version",
@@ -213,11 +231,11 @@ metadata文件格式:
         return 1
 
     if args.command == "export":
-        return export_metadata(args.model, args.output)
+        return export_metadata(args.model, args.output, args.check)
     elif args.command == "import":
-        return import_metadata(args.model, args.metadata, args.output, args.mode)
+        return import_metadata(args.model, args.metadata, args.output, args.mode, args.check)
     elif args.command == "list":
-        return list_metadata(args.model)
+        return list_metadata(args.model, args.check)
 
     return 1
 
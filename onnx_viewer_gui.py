@@ -4,19 +4,531 @@ ONNX模型信息探索器 - GUI应用程序
 用于探索和显示ONNX模型的详细信息
 """
 
+import io
 import sys
+import math
 import onnx
-from collections import defaultdict
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from onnx import AttributeProto, helper, numpy_helper
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QTextEdit, QFileDialog,
-    QGroupBox, QTreeWidget, QTreeWidgetItem, QSplitter, QFrame,
-    QHeaderView, QTabWidget, QTableWidget, QTableWidgetItem
+    QGroupBox, QTreeView, QTableView, QListView, QSplitter, QFrame, QCheckBox,
+    QHeaderView, QTabWidget, QProgressBar
+)
+from PyQt5.QtCore import (
+    Qt, QAbstractItemModel, QAbstractTableModel, QAbstractListModel, QModelIndex,
+    QObject, QThread, pyqtSignal
 )
-from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
+from _fastparse import open_mapping, parse_model_proto
+
+# 数据类型名称, 按 TensorProto.DataType 枚举值索引
+_DTYPE_NAMES = (
+    "UNDEFINED", "FLOAT32", "UINT8", "INT8",
+    "UINT16", "INT16", "INT32", "INT64",
+    "STRING", "BOOL", "FLOAT16", "DOUBLE",
+    "UINT32", "UINT64", "COMPLEX64",
+    "COMPLEX128", "BFLOAT16",
+)
+
+
+def get_tensor_shape(tensor):
+    """获取张量形状"""
+    tensor_type = tensor.type.tensor_type
+    dims = tensor_type.shape.dim if tensor_type.HasField("shape") else ()
+    shape = [str(dim.dim_value) if dim.dim_value > 0 else (dim.dim_param or "?") for dim in dims]
+    return "[" + ", ".join(shape) + "]"
+
+
+def get_dtype_name(dtype):
+    """获取数据类型名称"""
+    if 0 <= dtype < len(_DTYPE_NAMES):
+        return _DTYPE_NAMES[dtype]
+    return f"UNKNOWN({dtype})"
+
+
+# 列表属性超过该长度时默认只显示前若干个值
+ATTR_PREVIEW_LEN = 32
+
+# 完整显示长列表属性时每行的元素个数, 过长的单行文本会让QTextEdit排版极慢
+ATTR_VALUES_PER_LINE = 16
+
+# 列表类型的属性: 属性类型 -> (取值函数, 元素转换函数)
+_ATTR_LISTS = {
+    AttributeProto.FLOATS: (lambda attr: attr.floats, float),
+    AttributeProto.INTS: (lambda attr: attr.ints, int),
+    AttributeProto.STRINGS: (lambda attr: attr.strings, lambda s: s.decode('utf-8', 'replace')),
+}
+
+# 按属性类型取值, 未列出的类型 (张量、子图等) 直接转为字符串
+_ATTR_DISPATCH = {
+    AttributeProto.FLOAT: lambda attr: attr.f,
+    AttributeProto.INT: lambda attr: attr.i,
+    AttributeProto.STRING: lambda attr: attr.s.decode('utf-8', 'replace'),
+}
+
+
+def _summarize_tensor(tensor):
+    """张量属性的简要说明, 不展开其中的数值"""
+    return f"<张量 {list(tensor.dims)} {get_dtype_name(tensor.data_type)}, {tensor.ByteSize()} bytes>"
+
+
+# 张量、子图等属性完整展开可能有数MB, 始终只显示摘要
+_ATTR_SUMMARY = {
+    AttributeProto.TENSOR: lambda attr: _summarize_tensor(attr.t),
+    AttributeProto.TENSORS: lambda attr: f"<{len(attr.tensors)} 个张量>",
+    AttributeProto.GRAPH: lambda attr: f"<子图 {attr.g.name}: {len(attr.g.node)} 个节点>",
+    AttributeProto.GRAPHS: lambda attr: f"<{len(attr.graphs)} 个子图>",
+}
+
+
+def is_attr_truncated(attr, limit=ATTR_PREVIEW_LEN):
+    """列表属性值是否会被截断 (张量和子图的摘要不算截断, 完整显示时也不展开)"""
+    entry = _ATTR_LISTS.get(attr.type)
+    return entry is not None and len(entry[0](attr)) > limit
+
+
+def get_attr_value(attr, limit=ATTR_PREVIEW_LEN):
+    """获取属性值
+
+    Args:
+        attr: AttributeProto
+        limit: 列表属性最多显示的元素个数, None表示完整显示
+
+    Returns:
+        属性值; 超过limit的列表返回截断后的文本, 完整显示的长列表返回分行的文本,
+        张量和子图返回摘要
+    """
+    summarize = _ATTR_SUMMARY.get(attr.type)
+    if summarize is not None:
+        return summarize(attr)
+
+    entry = _ATTR_LISTS.get(attr.type)
+    if entry is None:
+        return _ATTR_DISPATCH.get(attr.type, str)(attr)
+
+    values, convert = entry[0](attr), entry[1]
+    if limit is not None and len(values) > limit:
+        head = ", ".join(repr(convert(value)) for value in values[:limit])
+        return f"[{head}, ... (共 {len(values)} 个)]"
+    if limit is None and len(values) > ATTR_VALUES_PER_LINE:
+        items = [repr(convert(value)) for value in values]
+        lines = (
+            "      " + ", ".join(items[i:i + ATTR_VALUES_PER_LINE]) + ","
+            for i in range(0, len(items), ATTR_VALUES_PER_LINE)
+        )
+        return "[\n" + "\n".join(lines) + f"\n    ] (共 {len(values)} 个)"
+    return [convert(value) for value in values]
+
+
+@contextmanager
+def suspend_view(view):
+    """批量更新视图的模型期间暂停排序、重绘以及视图和选择模型的信号, 结束后统一恢复"""
+    view.clearSelection()
+    sorting = view.isSortingEnabled() if hasattr(view, "isSortingEnabled") else False
+    if sorting:
+        view.setSortingEnabled(False)
+    selection_model = view.selectionModel()
+    view.setUpdatesEnabled(False)
+    view.blockSignals(True)
+    selection_model.blockSignals(True)
+    try:
+        yield
+    finally:
+        selection_model.blockSignals(False)
+        view.blockSignals(False)
+        view.setUpdatesEnabled(True)
+        if sorting:
+            view.setSortingEnabled(True)
+
+
+# 每个元素占4位、两两打包存储的数据类型
+_PACKED_4BIT_DTYPES = {
+    getattr(onnx.TensorProto, name)
+    for name in ("INT4", "UINT4", "FLOAT4E2M1")
+    if hasattr(onnx.TensorProto, name)
+}
+
+
+# onnx 1.13之前没有 helper.tensor_dtype_to_np_dtype
+if hasattr(helper, "tensor_dtype_to_np_dtype"):
+    _tensor_dtype_to_np_dtype = helper.tensor_dtype_to_np_dtype
+else:
+    from onnx.mapping import TENSOR_TYPE_TO_NP_TYPE as _TENSOR_TYPE_TO_NP_TYPE
+
+    def _tensor_dtype_to_np_dtype(data_type):
+        return _TENSOR_TYPE_TO_NP_TYPE[data_type]
+
+
+class LazyInitializer:
+    """按需读取权重数据的初始值
+
+    原始数据留在内存映射的模型文件中, 只记录其偏移和长度,
+    用户预览数值时才复制出需要的部分; 使用类型化数据字段 (float_data等) 的张量
+    记录的是整个序列化张量的位置, 预览时整体解析
+    """
+
+    def __init__(self, tensor, buffer, offset, nbytes, raw=True):
+        self.tensor = tensor
+        self.nbytes = nbytes
+        self.raw = raw
+        self._buffer = buffer
+        self._offset = offset
+
+    def head(self, count):
+        """只读取并解码前count个元素, 返回一维numpy数组"""
+        if not self.raw:
+            tensor = onnx.TensorProto()
+            tensor.ParseFromString(self._buffer[self._offset:self._offset + self.nbytes])
+            return numpy_helper.to_array(tensor).reshape(-1)[:count]
+
+        data_type = self.tensor.data_type
+        count = min(count, math.prod(self.tensor.dims))
+        if data_type in _PACKED_4BIT_DTYPES:
+            nbytes = (count + 1) // 2
+        else:
+            nbytes = count * _tensor_dtype_to_np_dtype(data_type).itemsize
+
+        tensor = onnx.TensorProto(data_type=data_type, dims=[count])
+        tensor.raw_data = self._buffer[self._offset:self._offset + nbytes]
+        return numpy_helper.to_array(tensor)
+
+
+def load_model_file(file_path):
+    """以内存映射方式加载模型, 不加载外部权重
+
+    解析前先从序列化数据中去掉初始值的权重数据, 权重不进入Python堆,
+    改由LazyInitializer从映射中按需读取
+
+    Args:
+        file_path: ONNX模型文件路径
+
+    Returns:
+        (ModelProto, 映射对象, {初始值名称: LazyInitializer})
+    """
+    buffer = open_mapping(file_path)
+    if buffer is None:
+        # 空文件
+        model, _ = parse_model_proto(b"")
+        return model, None, {}
+
+    try:
+        model, spans = parse_model_proto(buffer)
+    except Exception:
+        buffer.close()
+        raise
+
+    lazy_data = {}
+    for init in model.graph.initializer:
+        span = spans.get(init.name)
+        if span is not None:
+            lazy_data[init.name] = LazyInitializer(init, buffer, *span)
+    return model, buffer, lazy_data
+
+
+class LoadWorker(QObject):
+    """在后台线程中加载模型, 避免解析大模型时界面卡死"""
+
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+
+    def run(self):
+        """加载模型, 结果通过信号发回主线程"""
+        try:
+            result = load_model_file(self.file_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.loaded.emit(result)
+
+
+class ValidateWorker(QObject):
+    """在后台线程中用onnx.checker校验模型, 避免校验大模型时界面卡死"""
+
+    passed = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+
+    def run(self):
+        """校验模型, 结果通过信号发回主线程"""
+        try:
+            onnx.checker.check_model(self.file_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.passed.emit()
+
+
+class OnnxTreeModel(QAbstractItemModel):
+    """模型结构树的数据模型
+
+    不为每个节点预先创建条目, 只在视图请求某一行时才生成其显示文本。
+    索引的internalPointer是描述该行位置的元组:
+        ("category", 分类)          顶层分类
+        ("group", 算子序号)          [OP] 节点下的算子类型分组
+        ("node", 算子序号, 组内序号)  分组下的节点 (唯一层模式下为一类重复层)
+        ("tensor", 分类, 序号)       输入/输出/初始值
+    """
+
+    INPUT, NODE, INITIALIZER, OUTPUT = range(4)
+
+    CATEGORY_LABELS = {
+        INPUT: "[IN] 输入",
+        NODE: "[OP] 节点",
+        INITIALIZER: "[W] 初始值 (权重)",
+        OUTPUT: "[OUT] 输出",
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._graph = None
+        self._descriptors = {}
+        self._categories = []
+        self._op_types = []
+        self._op_groups = []
+        self._op_group_lens = []
+        self._layer_counts = None
+        self._keys = {}
+
+    def set_graph(self, graph, op_groups, descriptors, layer_counts=None):
+        """设置要展示的计算图
+
+        Args:
+            graph: 计算图
+            op_groups: {操作类型: 该类型节点在graph.node中的下标列表}
+            descriptors: {分类: [(名称, 形状, 数据类型), ...]}, 输入/输出/初始值的显示信息
+            layer_counts: 唯一层模式下 {代表节点下标: 相同层的数量}, 否则为None
+        """
+        self.beginResetModel()
+        self._graph = graph
+        self._descriptors = descriptors
+        self._layer_counts = layer_counts
+
+        self._op_types = sorted(op_groups.keys())
+        self._op_groups = [op_groups[op_type] for op_type in self._op_types]
+        self._op_group_lens = [len(group) for group in self._op_groups]
+
+        self._categories = [self.INPUT, self.NODE]
+        if graph.initializer:
+            self._categories.append(self.INITIALIZER)
+        self._categories.append(self.OUTPUT)
+
+        self._keys = {}
+        self.endResetModel()
+
+    def _key(self, *key):
+        """返回唯一的key元组, 保持引用使internalPointer始终有效"""
+        return self._keys.setdefault(key, key)
+
+    def _tensors(self, category):
+        """获取分类对应的张量列表"""
+        if category == self.INPUT:
+            return self._graph.input
+        if category == self.OUTPUT:
+            return self._graph.output
+        return self._graph.initializer
+
+    def item_at(self, index):
+        """获取索引对应的 (类型, 对象), 分类和分组行返回None"""
+        if not index.isValid():
+            return None
+        key = index.internalPointer()
+        if key[0] == "node":
+            return "node", self._graph.node[self._op_groups[key[1]][key[2]]]
+        if key[0] == "tensor":
+            category = key[1]
+            kind = {self.INPUT: "input", self.OUTPUT: "output", self.INITIALIZER: "initializer"}[category]
+            return kind, self._tensors(category)[key[2]]
+        return None
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            key = self._key("category", self._categories[row])
+        else:
+            parent_key = parent.internalPointer()
+            if parent_key[0] == "group":
+                key = self._key("node", parent_key[1], row)
+            elif parent_key[1] == self.NODE:
+                key = self._key("group", row)
+            else:
+                key = self._key("tensor", parent_key[1], row)
+        return self.createIndex(row, column, key)
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        key = index.internalPointer()
+        if key[0] == "category":
+            return QModelIndex()
+        if key[0] == "node":
+            return self.createIndex(key[1], 0, self._key("group", key[1]))
+        category = self.NODE if key[0] == "group" else key[1]
+        return self.createIndex(self._categories.index(category), 0, self._key("category", category))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0 or self._graph is None:
+            return 0
+        if not parent.isValid():
+            return len(self._categories)
+        key = parent.internalPointer()
+        if key[0] == "category":
+            if key[1] == self.NODE:
+                return len(self._op_types)
+            return len(self._descriptors[key[1]])
+        if key[0] == "group":
+            return self._op_group_lens[key[1]]
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return "节点层级"
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        key = index.internalPointer()
+
+        if key[0] == "category":
+            return self.CATEGORY_LABELS[key[1]]
+
+        if key[0] == "group":
+            return f"{self._op_types[key[1]]} ({self._op_group_lens[key[1]]})"
+
+        if key[0] == "node":
+            node_index = self._op_groups[key[1]][key[2]]
+            node = self._graph.node[node_index]
+            if self._layer_counts is not None:
+                return f"{node.op_type} ×{self._layer_counts[node_index]}\n示例: {node.name}"
+            inputs = ", ".join(node.input) if node.input else "无"
+            outputs = ", ".join(node.output) if node.output else "无"
+            return f"{node.name}\n输入: {inputs}\n输出: {outputs}"
+
+        name, shape, dtype = self._descriptors[key[1]][key[2]]
+        if key[1] == self.INITIALIZER:
+            return f"{name}\n形状: {shape} | {dtype}"
+        return f"{name}\n{shape} | {dtype}"
+
+
+class IoTableModel(QAbstractTableModel):
+    """输入输出表格的数据模型
+
+    使用加载时预先生成的 (名称, 形状, 数据类型), 不再逐个单元格访问protobuf
+    """
+
+    HEADERS = ["名称", "类型", "形状", "数据类型"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._num_inputs = 0
+
+    def set_descriptors(self, descriptors, num_inputs):
+        """设置表格内容
+
+        Args:
+            descriptors: [(名称, 形状, 数据类型), ...], 先输入后输出
+            num_inputs: 其中输入的个数
+        """
+        self.beginResetModel()
+        self._rows = descriptors
+        self._num_inputs = num_inputs
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = index.row()
+        column = index.column()
+        if column == 1:
+            return "输入" if row < self._num_inputs else "输出"
+        name, shape, dtype = self._rows[row]
+        if column == 0:
+            return name
+        return shape if column == 2 else dtype
+
+
+class GraphNodeListModel(QAbstractListModel):
+    """图属性页的节点列表数据模型
+
+    每行对应graph.node中的一个节点, 视图第一次请求该行时才生成其文本并缓存,
+    不再把所有节点拼成一整篇文档交给QTextEdit排版。
+    视图计算行高和绘制时会反复请求同一行, 缓存避免重复格式化
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._nodes = []
+        self._rows = []
+
+    def set_graph(self, graph):
+        """设置要展示的计算图"""
+        self.beginResetModel()
+        self._nodes = graph.node
+        self._rows = [None] * len(graph.node)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._nodes)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = index.row()
+        text = self._rows[row]
+        if text is None:
+            text = self._rows[row] = self._format_node(row)
+        return text
+
+    def _format_node(self, row):
+        """生成一个节点的显示文本"""
+        node = self._nodes[row]
+
+        lines = [f"[{row}] {node.op_type} - {node.name}"]
+        append = lines.append
+        if node.attribute:
+            append("  属性:")
+            lines.extend(f"    - {attr.name}: {get_attr_value(attr)}" for attr in node.attribute)
+        comma_join = ", ".join
+        if node.input:
+            append("  输入: " + comma_join(node.input))
+        if node.output:
+            append("  输出: " + comma_join(node.output))
+        return "\n".join(lines)
+
 
 class ONNXModelExplorer(QMainWindow):
     """ONNX模型信息探索器主窗口"""
@@ -25,6 +537,21 @@ class ONNXModelExplorer(QMainWindow):
         super().__init__()
         self.model = None
         self.model_path = None
+        self._buffer = None
+        self._lazy_data = {}
+        self._preview_target = None
+        self._full_attr_target = None
+        self._op_groups = {}
+        self._op_count = Counter()
+        self._unique_layers = None
+        self._graph_info_dirty = False
+        self._io_descriptors = []
+        self._init_descriptors = []
+        self._num_inputs = 0
+        self._load_thread = None
+        self._load_worker = None
+        self._validate_thread = None
+        self._validate_worker = None
         self.init_ui()
 
     def init_ui(self):
@@ -62,6 +589,13 @@ class ONNXModelExplorer(QMainWindow):
         # 状态栏
         self.statusBar().showMessage("请加载ONNX模型文件 | 版本 2.0.0")
 
+        # 加载进度 (不确定进度的忙碌指示)
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 0)
+        self.load_progress.setMaximumWidth(150)
+        self.load_progress.hide()
+        self.statusBar().addPermanentWidget(self.load_progress)
+
     def create_file_panel(self):
         """创建文件选择面板"""
         panel = QFrame()
@@ -93,6 +627,13 @@ class ONNXModelExplorer(QMainWindow):
         self.load_btn.clicked.connect(self.load_model)
         layout.addWidget(self.load_btn)
 
+        # 校验按钮 (加载时不做校验, 需要时手动触发)
+        self.validate_btn = QPushButton("校验模型")
+        self.validate_btn.setFixedWidth(100)
+        self.validate_btn.setEnabled(False)
+        self.validate_btn.clicked.connect(self.validate_model)
+        layout.addWidget(self.validate_btn)
+
         return panel
 
     def create_structure_panel(self):
@@ -107,10 +648,16 @@ class ONNXModelExplorer(QMainWindow):
         title.setFont(QFont("Arial", 12, QFont.Bold))
         layout.addWidget(title)
 
+        # 唯一层模式: 操作类型和属性都相同的节点合并为一行
+        self.unique_layers_check = QCheckBox("仅显示唯一层")
+        self.unique_layers_check.toggled.connect(self.update_structure_tree)
+        layout.addWidget(self.unique_layers_check)
+
         # 树形控件
-        self.structure_tree = QTreeWidget()
-        self.structure_tree.setHeaderLabel("节点层级")
-        self.structure_tree.itemClicked.connect(self.on_tree_item_clicked)
+        self.tree_model = OnnxTreeModel(self)
+        self.structure_tree = QTreeView()
+        self.structure_tree.setModel(self.tree_model)
+        self.structure_tree.clicked.connect(self.on_tree_item_clicked)
         layout.addWidget(self.structure_tree)
 
         return panel
@@ -135,6 +682,7 @@ class ONNXModelExplorer(QMainWindow):
         overview_layout = QVBoxLayout(overview_tab)
         self.overview_text = QTextEdit()
         self.overview_text.setReadOnly(True)
+        self.overview_text.setAcceptRichText(False)
         self.overview_text.setFont(QFont("Consolas", 9))
         overview_layout.addWidget(self.overview_text)
         self.tab_widget.addTab(overview_tab, "概览")
@@ -142,10 +690,12 @@ class ONNXModelExplorer(QMainWindow):
         # 输入输出标签页
         io_tab = QWidget()
         io_layout = QVBoxLayout(io_tab)
-        self.io_table = QTableWidget()
-        self.io_table.setColumnCount(4)
-        self.io_table.setHorizontalHeaderLabels(["名称", "类型", "形状", "数据类型"])
+        self.io_model = IoTableModel(self)
+        self.io_table = QTableView()
+        self.io_table.setModel(self.io_model)
         self.io_table.horizontalHeader().setStretchLastSection(True)
+        # 固定行高, 视图无需逐行测量
+        self.io_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         io_layout.addWidget(self.io_table)
         self.tab_widget.addTab(io_tab, "输入/输出")
 
@@ -154,18 +704,41 @@ class ONNXModelExplorer(QMainWindow):
         node_layout = QVBoxLayout(node_tab)
         self.node_detail_text = QTextEdit()
         self.node_detail_text.setReadOnly(True)
+        self.node_detail_text.setAcceptRichText(False)
         self.node_detail_text.setFont(QFont("Consolas", 9))
         node_layout.addWidget(self.node_detail_text)
+        node_btn_layout = QHBoxLayout()
+        node_btn_layout.addStretch()
+        self.full_attr_btn = QPushButton("显示完整属性")
+        self.full_attr_btn.setEnabled(False)
+        self.full_attr_btn.clicked.connect(self.show_full_attributes)
+        node_btn_layout.addWidget(self.full_attr_btn)
+        self.preview_btn = QPushButton("预览数值")
+        self.preview_btn.setEnabled(False)
+        self.preview_btn.clicked.connect(self.preview_initializer)
+        node_btn_layout.addWidget(self.preview_btn)
+        node_layout.addLayout(node_btn_layout)
         self.tab_widget.addTab(node_tab, "节点详情")
 
         # 图形属性标签页
         graph_tab = QWidget()
         graph_layout = QVBoxLayout(graph_tab)
-        self.graph_text = QTextEdit()
-        self.graph_text.setReadOnly(True)
-        self.graph_text.setFont(QFont("Consolas", 9))
-        graph_layout.addWidget(self.graph_text)
-        self.tab_widget.addTab(graph_tab, "图属性")
+        self.graph_header = QLabel()
+        self.graph_header.setFont(QFont("Consolas", 9))
+        graph_layout.addWidget(self.graph_header)
+        self.graph_model = GraphNodeListModel(self)
+        self.graph_list = QListView()
+        self.graph_list.setModel(self.graph_model)
+        self.graph_list.setFont(QFont("Consolas", 9))
+        self.graph_list.setAlternatingRowColors(True)
+        # 各节点文本行数不同, 不能使用统一行高; 分批布局, 避免一次测量所有行
+        self.graph_list.setLayoutMode(QListView.Batched)
+        self.graph_list.setBatchSize(100)
+        graph_layout.addWidget(self.graph_list)
+        self.graph_tab_index = self.tab_widget.addTab(graph_tab, "图属性")
+
+        # 切换到图属性标签页时才更新
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
 
         layout.addWidget(self.tab_widget)
 
@@ -186,25 +759,171 @@ class ONNXModelExplorer(QMainWindow):
             self.statusBar().showMessage("[!] 请先选择模型文件")
             return
 
+        if self._load_thread is not None:
+            return
+
+        self.statusBar().showMessage("[*] 正在加载模型...")
+        self.load_btn.setEnabled(False)
+        self.load_progress.show()
+
+        # 在后台线程中解析, 完成后由信号回到主线程更新UI
+        self._load_thread = QThread(self)
+        self._load_worker = LoadWorker(file_path)
+        self._load_worker.moveToThread(self._load_thread)
+        self._load_thread.started.connect(self._load_worker.run)
+        self._load_worker.loaded.connect(self._on_model_loaded)
+        self._load_worker.failed.connect(self._on_model_load_failed)
+        self._load_thread.start()
+
+    def _finish_loading(self):
+        """结束后台加载线程并恢复界面状态, 返回加载的文件路径"""
+        file_path = self._load_worker.file_path
+        self._load_thread.quit()
+        self._load_thread.wait()
+        self._load_worker.deleteLater()
+        self._load_thread.deleteLater()
+        self._load_thread = None
+        self._load_worker = None
+
+        self.load_progress.setVisible(self._validate_thread is not None)
+        self.load_btn.setEnabled(True)
+        return file_path
+
+    def _on_model_loaded(self, result):
+        """模型加载完成"""
+        file_path = self._finish_loading()
+        model, buffer, lazy_data = result
+
         try:
-            self.statusBar().showMessage("[*] 正在加载模型...")
-            onnx.checker.check_model(file_path)
-            self.model = onnx.load(file_path)
+            self.close_model_file()
+            self.model = model
+            self._buffer = buffer
+            self._lazy_data = lazy_data
             self.model_path = file_path
+            self.validate_btn.setEnabled(self._validate_thread is None)
+            self.group_nodes()
+            self.describe_tensors()
 
             # 更新UI
             self.update_overview()
             self.update_io_table()
             self.update_structure_tree()
-            self.update_graph_info()
+            self._graph_info_dirty = True
+            if self.tab_widget.currentIndex() == self.graph_tab_index:
+                self.update_graph_info()
             self.clear_node_detail()
 
             self.statusBar().showMessage(f"[OK] 模型加载成功: {file_path}")
 
         except Exception as e:
-            self.statusBar().showMessage(f"[X] 加载失败: {str(e)}")
-            self.overview_text.clear()
-            self.overview_text.append(f"[X] 错误: {str(e)}")
+            self._show_load_error(str(e))
+
+    def _on_model_load_failed(self, message):
+        """模型加载失败"""
+        self._finish_loading()
+        self._show_load_error(message)
+
+    def _show_load_error(self, message):
+        """显示加载错误"""
+        self.statusBar().showMessage(f"[X] 加载失败: {message}")
+        self.overview_text.setPlainText(f"[X] 错误: {message}")
+
+    def closeEvent(self, event):
+        """关闭窗口前等待后台加载和校验结束"""
+        for thread in (self._load_thread, self._validate_thread):
+            if thread is not None:
+                thread.quit()
+                thread.wait()
+        super().closeEvent(event)
+
+    def close_model_file(self):
+        """释放当前模型文件的内存映射"""
+        self._lazy_data = {}
+        self._preview_target = None
+        self.preview_btn.setEnabled(False)
+        self._full_attr_target = None
+        self.full_attr_btn.setEnabled(False)
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+    def group_nodes(self):
+        """按操作类型分组节点, 供概览和结构树共用"""
+        op_groups = defaultdict(list)
+        for i, node in enumerate(self.model.graph.node):
+            op_groups[node.op_type].append(i)
+        self._op_groups = op_groups
+        self._op_count = Counter({op_type: len(group) for op_type, group in op_groups.items()})
+        self._unique_layers = None
+
+    def describe_tensors(self):
+        """预先生成输入输出和初始值的显示信息, 供输入输出表格和结构树共用"""
+        graph = self.model.graph
+        self._num_inputs = len(graph.input)
+        self._io_descriptors = [
+            (tensor.name, get_tensor_shape(tensor), get_dtype_name(tensor.type.tensor_type.elem_type))
+            for tensor in list(graph.input) + list(graph.output)
+        ]
+        self._init_descriptors = [
+            (init.name, list(init.dims), get_dtype_name(init.data_type))
+            for init in graph.initializer
+        ]
+
+    def group_unique_layers(self):
+        """按 (操作类型, 属性) 合并重复的层, 首次切换到唯一层模式时才计算
+
+        Returns:
+            {(操作类型, 属性): 节点下标列表}
+        """
+        if self._unique_layers is None:
+            unique_layers = defaultdict(list)
+            for i, node in enumerate(self.model.graph.node):
+                attrs = tuple(sorted(attr.SerializeToString() for attr in node.attribute))
+                unique_layers[(node.op_type, attrs)].append(i)
+            self._unique_layers = unique_layers
+        return self._unique_layers
+
+    def validate_model(self):
+        """用onnx.checker校验当前模型"""
+        if not self.model_path or self._validate_thread is not None:
+            return
+
+        self.statusBar().showMessage("[*] 正在校验模型...")
+        self.validate_btn.setEnabled(False)
+        self.load_progress.show()
+
+        # 校验在后台线程中进行, 完成后由信号回到主线程显示结果
+        self._validate_thread = QThread(self)
+        self._validate_worker = ValidateWorker(self.model_path)
+        self._validate_worker.moveToThread(self._validate_thread)
+        self._validate_thread.started.connect(self._validate_worker.run)
+        self._validate_worker.passed.connect(self._on_model_validated)
+        self._validate_worker.failed.connect(self._on_model_validate_failed)
+        self._validate_thread.start()
+
+    def _finish_validating(self):
+        """结束后台校验线程并恢复界面状态, 返回校验的文件路径"""
+        file_path = self._validate_worker.file_path
+        self._validate_thread.quit()
+        self._validate_thread.wait()
+        self._validate_worker.deleteLater()
+        self._validate_thread.deleteLater()
+        self._validate_thread = None
+        self._validate_worker = None
+
+        self.load_progress.setVisible(self._load_thread is not None)
+        self.validate_btn.setEnabled(bool(self.model_path))
+        return file_path
+
+    def _on_model_validated(self):
+        """模型校验通过"""
+        file_path = self._finish_validating()
+        self.statusBar().showMessage(f"[OK] 模型校验通过: {file_path}")
+
+    def _on_model_validate_failed(self, message):
+        """模型校验失败"""
+        self._finish_validating()
+        self.statusBar().showMessage(f"[X] 校验失败: {message}")
 
     def update_overview(self):
         """更新概览信息"""
@@ -242,12 +961,8 @@ class ONNXModelExplorer(QMainWindow):
         info.append(f"  - 初始值数量: {len(graph.initializer)}")
 
         # 按操作类型统计
-        op_count = defaultdict(int)
-        for node in graph.node:
-            op_count[node.op_type] += 1
-
-        info.append(f"\n[*] 操作类型统计 (共 {len(op_count)} 种):")
-        for op_type, count in sorted(op_count.items(), key=lambda x: -x[1]):
+        info.append(f"\n[*] 操作类型统计 (共 {len(self._op_count)} 种):")
+        for op_type, count in self._op_count.most_common():
             info.append(f"  - {op_type}: {count}")
 
         # IR版本
@@ -257,157 +972,83 @@ class ONNXModelExplorer(QMainWindow):
         if self.model.producer_name:
             info.append(f"\n[*] 生产者: {self.model.producer_name} {self.model.producer_version or ''}")
 
-        self.overview_text.clear()
-        self.overview_text.append("\n".join(info))
+        self.overview_text.setPlainText("\n".join(info))
 
     def update_io_table(self):
         """更新输入输出表格"""
         if not self.model:
             return
 
-        self.io_table.setRowCount(0)
-
-        graph = self.model.graph
-
-        # 添加输入
-        for input_tensor in graph.input:
-            row = self.io_table.rowCount()
-            self.io_table.insertRow(row)
-            self.io_table.setItem(row, 0, QTableWidgetItem(input_tensor.name))
-            self.io_table.setItem(row, 1, QTableWidgetItem("输入"))
-
-            # 获取形状
-            shape = self.get_tensor_shape(input_tensor)
-            self.io_table.setItem(row, 2, QTableWidgetItem(str(shape)))
-
-            # 获取数据类型
-            dtype = self.get_dtype_name(input_tensor.type.tensor_type.elem_type)
-            self.io_table.setItem(row, 3, QTableWidgetItem(dtype))
-
-        # 添加输出
-        for output_tensor in graph.output:
-            row = self.io_table.rowCount()
-            self.io_table.insertRow(row)
-            self.io_table.setItem(row, 0, QTableWidgetItem(output_tensor.name))
-            self.io_table.setItem(row, 1, QTableWidgetItem("输出"))
-
-            # 获取形状
-            shape = self.get_tensor_shape(output_tensor)
-            self.io_table.setItem(row, 2, QTableWidgetItem(str(shape)))
-
-            # 获取数据类型
-            dtype = self.get_dtype_name(output_tensor.type.tensor_type.elem_type)
-            self.io_table.setItem(row, 3, QTableWidgetItem(dtype))
-
-        # 调整列宽
-        self.io_table.resizeColumnsToContents()
+        with suspend_view(self.io_table):
+            self.io_model.set_descriptors(self._io_descriptors, self._num_inputs)
+            # 调整列宽 (视图只测量可见行)
+            self.io_table.resizeColumnsToContents()
 
     def update_structure_tree(self):
         """更新结构树"""
         if not self.model:
             return
 
-        self.structure_tree.clear()
+        num_inputs = self._num_inputs
+        descriptors = {
+            OnnxTreeModel.INPUT: self._io_descriptors[:num_inputs],
+            OnnxTreeModel.OUTPUT: self._io_descriptors[num_inputs:],
+            OnnxTreeModel.INITIALIZER: self._init_descriptors,
+        }
 
-        graph = self.model.graph
+        if self.unique_layers_check.isChecked():
+            # 每类重复层只显示第一个节点作为代表
+            op_groups = defaultdict(list)
+            layer_counts = {}
+            for (op_type, _), indices in self.group_unique_layers().items():
+                op_groups[op_type].append(indices[0])
+                layer_counts[indices[0]] = len(indices)
+        else:
+            op_groups, layer_counts = self._op_groups, None
 
-        # 添加输入节点
-        input_item = QTreeWidgetItem(["[IN] 输入"])
-        for input_tensor in graph.input:
-            shape = self.get_tensor_shape(input_tensor)
-            dtype = self.get_dtype_name(input_tensor.type.tensor_type.elem_type)
-            item = QTreeWidgetItem([f"{input_tensor.name}\n{shape} | {dtype}"])
-            item.setData(0, Qt.UserRole, {"type": "input", "tensor": input_tensor})
-            input_item.addChild(item)
-        self.structure_tree.addTopLevelItem(input_item)
-
-        # 按操作类型分组节点
-        op_groups = defaultdict(list)
-        for node in graph.node:
-            op_groups[node.op_type].append(node)
-
-        # 添加节点
-        nodes_item = QTreeWidgetItem(["[OP] 节点"])
-        for op_type in sorted(op_groups.keys()):
-            op_item = QTreeWidgetItem([f"{op_type} ({len(op_groups[op_type])})"])
-            for node in op_groups[op_type]:
-                inputs = ", ".join(node.input) if node.input else "无"
-                outputs = ", ".join(node.output) if node.output else "无"
-                item_text = f"{node.name}\n输入: {inputs}\n输出: {outputs}"
-                item = QTreeWidgetItem([item_text])
-                item.setData(0, Qt.UserRole, {"type": "node", "node": node})
-                op_item.addChild(item)
-            nodes_item.addChild(op_item)
-        self.structure_tree.addTopLevelItem(nodes_item)
-
-        # 添加初始值
-        if graph.initializer:
-            init_item = QTreeWidgetItem(["[W] 初始值 (权重)"])
-            for init in graph.initializer:
-                dtype = self.get_dtype_name(init.data_type)
-                item = QTreeWidgetItem([f"{init.name}\n形状: {list(init.dims)} | {dtype}"])
-                item.setData(0, Qt.UserRole, {"type": "initializer", "tensor": init})
-                init_item.addChild(item)
-            self.structure_tree.addTopLevelItem(init_item)
-
-        # 添加输出节点
-        output_item = QTreeWidgetItem(["[OUT] 输出"])
-        for output_tensor in graph.output:
-            shape = self.get_tensor_shape(output_tensor)
-            dtype = self.get_dtype_name(output_tensor.type.tensor_type.elem_type)
-            item = QTreeWidgetItem([f"{output_tensor.name}\n{shape} | {dtype}"])
-            item.setData(0, Qt.UserRole, {"type": "output", "tensor": output_tensor})
-            output_item.addChild(item)
-        self.structure_tree.addTopLevelItem(output_item)
-
-        # 展开所有
-        self.structure_tree.expandAll()
+        # 重置模型和展开期间暂停重绘和信号, 结束后只布局一次
+        with suspend_view(self.structure_tree):
+            self.tree_model.set_graph(self.model.graph, op_groups, descriptors, layer_counts)
+            # 一次展开所有顶层分类, 节点分组等用户点开时再布局
+            self.structure_tree.expandToDepth(0)
+
+    def on_tab_changed(self, index):
+        """标签页切换事件"""
+        if index == self.graph_tab_index and self._graph_info_dirty:
+            self.update_graph_info()
 
     def update_graph_info(self):
         """更新图信息"""
         if not self.model:
             return
+        self._graph_info_dirty = False
 
         graph = self.model.graph
+        self.graph_header.setText(f"[*] 图名称: {graph.name}    [*] 所有节点 ({len(graph.node)} 个)")
+        with suspend_view(self.graph_list):
+            self.graph_model.set_graph(graph)
 
-        info = []
-        info.append("=" * 50)
-        info.append("计算图属性")
-        info.append("=" * 50)
-        info.append(f"\n[*] 图名称: {graph.name}")
-
-        # 节点详情
-        info.append(f"\n[*] 所有节点 ({len(graph.node)} 个):")
-        for i, node in enumerate(graph.node):
-            info.append(f"\n[{i}] {node.op_type} - {node.name}")
-            if node.attribute:
-                info.append("  属性:")
-                for attr in node.attribute:
-                    info.append(f"    - {attr.name}: {self.get_attr_value(attr)}")
-            if node.input:
-                info.append(f"  输入: {', '.join(node.input)}")
-            if node.output:
-                info.append(f"  输出: {', '.join(node.output)}")
-
-        self.graph_text.clear()
-        self.graph_text.append("\n".join(info))
-
-    def on_tree_item_clicked(self, item, column):
+    def on_tree_item_clicked(self, index):
         """树节点点击事件"""
-        data = item.data(0, Qt.UserRole)
-        if not data:
+        item = self.tree_model.item_at(index)
+        if not item:
             return
 
         self.tab_widget.setCurrentIndex(2)  # 切换到节点详情标签页
-
-        if data["type"] == "input":
-            self.show_tensor_info(data["tensor"], "输入")
-        elif data["type"] == "output":
-            self.show_tensor_info(data["tensor"], "输出")
-        elif data["type"] == "node":
-            self.show_node_info(data["node"])
-        elif data["type"] == "initializer":
-            self.show_initializer_info(data["tensor"])
+        self._preview_target = None
+        self.preview_btn.setEnabled(False)
+        self._full_attr_target = None
+        self.full_attr_btn.setEnabled(False)
+
+        item_type, obj = item
+        if item_type == "input":
+            self.show_tensor_info(obj, "输入")
+        elif item_type == "output":
+            self.show_tensor_info(obj, "输出")
+        elif item_type == "node":
+            self.show_node_info(obj)
+        elif item_type == "initializer":
+            self.show_initializer_info(obj)
 
     def show_tensor_info(self, tensor, tensor_type):
         """显示张量信息"""
@@ -416,8 +1057,8 @@ class ONNXModelExplorer(QMainWindow):
         info.append(f"{tensor_type}张量信息")
         info.append("=" * 50)
         info.append(f"\n[*] 名称: {tensor.name}")
-        info.append(f"\n[*] 形状: {self.get_tensor_shape(tensor)}")
-        info.append(f"\n[*] 数据类型: {self.get_dtype_name(tensor.type.tensor_type.elem_type)}")
+        info.append(f"\n[*] 形状: {get_tensor_shape(tensor)}")
+        info.append(f"\n[*] 数据类型: {get_dtype_name(tensor.type.tensor_type.elem_type)}")
 
         # 显示维度信息
         if tensor.type.tensor_type.shape.dim:
@@ -427,41 +1068,49 @@ class ONNXModelExplorer(QMainWindow):
                 dim_value = str(dim.dim_value) if hasattr(dim, 'dim_value') and dim.dim_value > 0 else dim_name
                 info.append(f"  - 维度 {i}: {dim_value}")
 
-        self.node_detail_text.clear()
-        self.node_detail_text.append("\n".join(info))
+        self.node_detail_text.setPlainText("\n".join(info))
 
-    def show_node_info(self, node):
-        """显示节点信息"""
-        info = []
-        info.append("=" * 50)
-        info.append("节点详细信息")
-        info.append("=" * 50)
-        info.append(f"\n[*] 节点名称: {node.name}")
-        info.append(f"\n[*] 操作类型: {node.op_type}")
+    def show_node_info(self, node, attr_limit=ATTR_PREVIEW_LEN):
+        """显示节点信息
+
+        Args:
+            node: NodeProto
+            attr_limit: 列表属性最多显示的元素个数, None表示完整显示
+        """
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 50 + "\n节点详细信息\n" + "=" * 50 + "\n")
+        write(f"\n[*] 节点名称: {node.name}\n")
+        write(f"\n[*] 操作类型: {node.op_type}\n")
 
         if node.domain:
-            info.append(f"\n[*] 域: {node.domain}")
+            write(f"\n[*] 域: {node.domain}\n")
 
         if node.input:
-            info.append(f"\n[*] 输入:")
-            for i, inp in enumerate(node.input):
-                info.append(f"  {i+1}. {inp}")
+            write("\n[*] 输入:\n")
+            buf.writelines(f"  {i}. {inp}\n" for i, inp in enumerate(node.input, 1))
 
         if node.output:
-            info.append(f"\n[*] 输出:")
-            for i, out in enumerate(node.output):
-                info.append(f"  {i+1}. {out}")
+            write("\n[*] 输出:\n")
+            buf.writelines(f"  {i}. {out}\n" for i, out in enumerate(node.output, 1))
 
         if node.attribute:
-            info.append(f"\n[*] 属性:")
-            for attr in node.attribute:
-                info.append(f"  - {attr.name}: {self.get_attr_value(attr)}")
+            write("\n[*] 属性:\n")
+            buf.writelines(f"  - {attr.name}: {get_attr_value(attr, attr_limit)}\n" for attr in node.attribute)
 
         if node.doc_string:
-            info.append(f"\n[*] 文档: {node.doc_string}")
+            write(f"\n[*] 文档: {node.doc_string}\n")
+
+        self.node_detail_text.setPlainText(buf.getvalue().rstrip("\n"))
 
-        self.node_detail_text.clear()
-        self.node_detail_text.append("\n".join(info))
+        truncated = attr_limit is not None and any(is_attr_truncated(attr, attr_limit) for attr in node.attribute)
+        self._full_attr_target = node if truncated else None
+        self.full_attr_btn.setEnabled(truncated)
+
+    def show_full_attributes(self):
+        """完整显示当前节点被截断的列表属性"""
+        if self._full_attr_target is not None:
+            self.show_node_info(self._full_attr_target, attr_limit=None)
 
     def show_initializer_info(self, init):
         """显示初始化器信息"""
@@ -471,86 +1120,42 @@ class ONNXModelExplorer(QMainWindow):
         info.append("=" * 50)
         info.append(f"\n[*] 名称: {init.name}")
         info.append(f"\n[*] 形状: {list(init.dims)}")
-        info.append(f"\n[*] 数据类型: {self.get_dtype_name(init.data_type)}")
+        info.append(f"\n[*] 数据类型: {get_dtype_name(init.data_type)}")
 
         # 计算大小
-        import numpy as np
-        total_elements = np.prod(init.dims) if init.dims else 0
+        total_elements = math.prod(init.dims) if init.dims else 0
         info.append(f"\n[*] 元素数量: {total_elements}")
 
         # 数据位置
-        if init.raw_data:
-            info.append(f"\n[*] 数据: 原始数据 ({len(init.raw_data)} bytes)")
-        elif hasattr(init, 'float_data') and init.float_data:
-            info.append(f"\n[*] 数据: float64数组 ({len(init.float_data)} 个值)")
-            if len(init.float_data) <= 10:
-                info.append(f"  值: {list(init.float_data)}")
-        elif hasattr(init, 'int64_data') and init.int64_data:
-            info.append(f"\n[*] 数据: int64数组 ({len(init.int64_data)} 个值)")
-
-        self.node_detail_text.clear()
-        self.node_detail_text.append("\n".join(info))
+        if init.data_location == onnx.TensorProto.EXTERNAL:
+            external = {entry.key: entry.value for entry in init.external_data}
+            info.append(f"\n[*] 数据: 外部文件 {external.get('location', '?')} ({external.get('length', '?')} bytes)")
+        elif init.name in self._lazy_data:
+            lazy = self._lazy_data[init.name]
+            if lazy.raw:
+                info.append(f"\n[*] 数据: 原始数据 ({lazy.nbytes} bytes)")
+            else:
+                info.append(f"\n[*] 数据: 类型化数组 (序列化 {lazy.nbytes} bytes)")
+
+        self.node_detail_text.setPlainText("\n".join(info))
+
+        self._preview_target = self._lazy_data.get(init.name)
+        self.preview_btn.setEnabled(self._preview_target is not None)
+
+    def preview_initializer(self):
+        """从模型文件中读取当前初始值的数据并预览前几个数值"""
+        if self._preview_target is None:
+            return
+
+        try:
+            values = self._preview_target.head(10)
+            self.node_detail_text.append(f"\n[*] 数值预览 (前 {len(values)} 个): {values.tolist()}")
+        except Exception as e:
+            self.node_detail_text.append(f"\n[X] 预览失败: {str(e)}")
 
     def clear_node_detail(self):
         """清除节点详情"""
-        self.node_detail_text.clear()
-        self.node_detail_text.append("请从左侧模型结构树中选择节点查看详细信息...")
-
-    def get_tensor_shape(self, tensor):
-        """获取张量形状"""
-        try:
-            dims = tensor.type.tensor_type.shape.dim
-            shape = []
-            for dim in dims:
-                if dim.dim_value > 0:
-                    shape.append(str(dim.dim_value))
-                elif dim.dim_param:
-                    shape.append(dim.dim_param)
-                else:
-                    shape.append("?")
-            return f"[{', '.join(shape)}]"
-        except:
-            return "[?]"
-
-    def get_dtype_name(self, dtype):
-        """获取数据类型名称"""
-        dtype_names = {
-            0: "UNDEFINED",
-            1: "FLOAT32",
-            2: "UINT8",
-            3: "INT8",
-            4: "UINT16",
-            5: "INT16",
-            6: "INT32",
-            7: "INT64",
-            8: "STRING",
-            9: "BOOL",
-            10: "FLOAT16",
-            11: "DOUBLE",
-            12: "UINT32",
-            13: "UINT64",
-            14: "COMPLEX64",
-            15: "COMPLEX128",
-            16: "BFLOAT16"
-        }
-        return dtype_names.get(dtype, f"UNKNOWN({dtype})")
-
-    def get_attr_value(self, attr):
-        """获取属性值"""
-        if attr.HasField('f'):
-            return attr.f
-        elif attr.HasField('i'):
-            return attr.i
-        elif attr.HasField('s'):
-            return attr.s.decode('utf-8')
-        elif attr.ints:
-            return list(attr.ints)
-        elif attr.floats:
-            return list(attr.floats)
-        elif attr.strings:
-            return [s.decode('utf-8') for s in attr.strings]
-        else:
-            return str(attr)
+        self.node_detail_text.setPlainText("请从左侧模型结构树中选择节点查看详细信息...")
 
 
 def main():